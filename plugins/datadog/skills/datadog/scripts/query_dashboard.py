@@ -10,60 +10,346 @@ curated and analyzed.
 import os
 import sys
 import json
+import gzip
+import hashlib
+import io
+import re
 import argparse
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import urllib.request
-import urllib.parse
-import urllib.error
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parse API responses straight from bytes; orjson is used when available
+# since it skips the bytes->str decode and is considerably faster
+_json_loads = orjson.loads if orjson else json.loads
+
+
+# Default number of widget queries in flight at once (keeps us well within
+# Datadog API rate limits while overlapping network round-trips)
+MAX_CONCURRENT_QUERIES = 16
+
+# Minimum size of the per-host HTTP connection pool; it is grown to match
+# the worker count so concurrent queries never open throwaway connections
+POOL_MAXSIZE = 32
+
+# Maximum number of queries sent in one v2 timeseries request in batch mode
+BATCH_QUERY_SIZE = 10
+
+# Client-side request pacing (Datadog's typical per-org limit) and how many
+# times a rate-limited (429) request is retried after waiting for the reset
+RATE_LIMIT_PER_MINUTE = 300
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Longest rate-limit reset worth waiting for; beyond this (e.g. an hourly
+# quota) the 429 is reported immediately instead of stalling the run
+MAX_RATE_LIMIT_WAIT_SECONDS = 60
+
+# On-disk response cache location and modes:
+#   enabled   - read from and write to the cache
+#   read-only - read from the cache, never write
+#   replay    - read from the cache, fail on a miss instead of calling the API
+#   disabled  - always call the API
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dd_dashq')
+CACHE_MODES = ['enabled', 'read-only', 'replay', 'disabled']
+
+# Query time ranges are rounded down to this boundary when building cache
+# keys, so re-runs with relative times ("1h ago") within a minute still hit
+CACHE_BUCKET_SECONDS = 60
+
+# Cached dashboard definitions have no time range in their key, so they
+# expire after this long to pick up edited widgets (replay mode ignores it)
+DASHBOARD_CACHE_TTL_SECONDS = 900
+
+# How long the in-memory dashboard list (used by search) stays fresh
+DASHBOARD_LIST_TTL_SECONDS = 300
+
+# Absolute datetime formats accepted by parse_datetime
+_DT_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%Y-%m-%dT%H:%M',
+)
+
+# Relative time such as "30m" or "2h" (followed by "ago")
+_RELATIVE_TIME_RE = re.compile(r'(\d+)([a-z]+)')
+
+# Relative time unit aliases mapped to timedelta keyword arguments
+_TIME_UNITS = {
+    'm': 'minutes', 'min': 'minutes', 'minute': 'minutes', 'minutes': 'minutes',
+    'h': 'hours', 'hr': 'hours', 'hour': 'hours', 'hours': 'hours',
+    'd': 'days', 'day': 'days', 'days': 'days',
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket for pacing API requests."""
+
+    def __init__(self, rate_per_min: float):
+        """Initialize a full bucket.
+
+        Args:
+            rate_per_min: Tokens replenished per minute (also the bucket capacity)
+        """
+        self.rate_per_min = rate_per_min
+        self.tokens = float(rate_per_min)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.tokens = min(self.rate_per_min, self.tokens + elapsed * self.rate_per_min / 60)
+        self.updated_at = now
+
+    def acquire(self, tokens: int = 1):
+        """Take tokens from the bucket, sleeping until enough are available."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) * 60 / self.rate_per_min
+            time.sleep(wait)
+
+    def drain(self, seconds: float):
+        """Empty the bucket so no tokens become available for `seconds`."""
+        with self._lock:
+            self._refill()
+            self.tokens = -seconds * self.rate_per_min / 60
 
 
 class DatadogDashboardQuery:
     """Query Datadog dashboard and execute widget queries."""
 
-    def __init__(self, api_key: str, app_key: str, site: str = 'datadoghq.eu'):
+    def __init__(
+        self,
+        api_key: str,
+        app_key: str,
+        site: str = 'datadoghq.eu',
+        cache_mode: str = 'disabled',
+        cache_dir: str = CACHE_DIR,
+        max_workers: int = MAX_CONCURRENT_QUERIES,
+        rate_limit_per_min: float = RATE_LIMIT_PER_MINUTE
+    ):
         """Initialize Datadog API client.
 
         Args:
             api_key: Datadog API key
             app_key: Datadog application key
             site: Datadog site (default: datadoghq.eu, can be datadoghq.com)
+            cache_mode: On-disk cache mode, one of CACHE_MODES (default: disabled)
+            cache_dir: Directory for cached responses
+            max_workers: Maximum number of queries executed concurrently
+            rate_limit_per_min: Maximum API requests per minute across all threads
         """
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(f"Invalid cache mode: {cache_mode}")
+
         self.api_key = api_key
         self.app_key = app_key
         self.base_url = f"https://api.{site}"
-
-    def _make_request(self, endpoint: str, method: str = 'GET') -> Dict:
+        self.cache_mode = cache_mode
+        self.cache_dir = cache_dir
+        # Hash of the API key so cache entries never cross Datadog orgs
+        # sharing a site (the raw key is never written to disk)
+        self._cache_owner = hashlib.sha256(api_key.encode()).hexdigest()
+        self.max_workers = max_workers
+        self._bucket = TokenBucket(rate_limit_per_min)
+
+        # In-memory dashboard list and lowercased title index for searches
+        self._dashboards: Optional[List[Dict]] = None
+        self._dashboards_fetched_at = 0.0
+        self._title_index: List[Tuple[Dict, str]] = []
+
+        # Shared session so every API call (including those from worker
+        # threads) reuses pooled keep-alive connections instead of paying a
+        # fresh TCP+TLS handshake. requests also sends
+        # "Accept-Encoding: gzip, deflate" by default and transparently
+        # decompresses responses, so large dashboard/series payloads travel
+        # compressed and response.content is already decoded.
+        self.session = requests.Session()
+        self.session.headers.update({
+            'DD-API-KEY': api_key,
+            'DD-APPLICATION-KEY': app_key,
+            'Content-Type': 'application/json'
+        })
+        self.session.mount(
+            'https://',
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=max(POOL_MAXSIZE, max_workers)
+            )
+        )
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _make_request(
+        self,
+        endpoint: str,
+        method: str = 'GET',
+        params: Optional[Dict] = None,
+        body: Optional[Dict] = None
+    ) -> Dict:
         """Make a request to Datadog API.
 
         Args:
             endpoint: API endpoint path
             method: HTTP method (GET, POST, etc.)
+            params: Optional query string parameters
+            body: Optional JSON request body
 
         Returns:
             Dict with API response
         """
         url = f"{self.base_url}{endpoint}"
-        req = urllib.request.Request(url, method=method)
-        req.add_header('DD-API-KEY', self.api_key)
-        req.add_header('DD-APPLICATION-KEY', self.app_key)
-        req.add_header('Content-Type', 'application/json')
 
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self._bucket.acquire()
+            response = self.session.request(method, url, params=params, json=body)
+
+            if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+
+            # Rate limited: hold back every thread until the window resets
+            # (X-RateLimit-Reset is the number of seconds remaining), then retry
+            try:
+                reset = float(response.headers.get('X-RateLimit-Reset', 1))
+            except ValueError:
+                reset = 1.0
+
+            if reset > MAX_RATE_LIMIT_WAIT_SECONDS:
+                break
+
+            print(f"Rate limited by Datadog, retrying in {reset:.0f}s", file=sys.stderr)
+            self._bucket.drain(reset)
+
+        if not response.ok:
+            raise Exception(f"Datadog API error: {response.status_code} - {response.text}")
+
+        return _json_loads(response.content)
+
+    def _cache_key(self, *parts) -> str:
+        """Build a cache key from request parts, the API base URL and the org."""
+        raw = '|'.join(str(p) for p in (*parts, self.base_url, self._cache_owner))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.json.gz')
+
+    def _cache_get(self, key: str, max_age: Optional[float] = None) -> Optional[Dict]:
+        """Load a cached response, or None if missing/unreadable or caching is off.
+
+        Args:
+            key: Cache key (from _cache_key)
+            max_age: Optional maximum entry age in seconds; older entries are
+                treated as misses except in replay mode
+        """
+        if self.cache_mode == 'disabled':
+            return None
+
+        path = self._cache_path(key)
+        try:
+            if (max_age is not None and self.cache_mode != 'replay'
+                    and time.time() - os.path.getmtime(path) > max_age):
+                return None
+
+            with gzip.open(path, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, EOFError, ValueError):
+            return None
+
+    def _cache_put(self, key: str, value: Dict):
+        """Store a response in the cache (only in 'enabled' mode).
+
+        Caching is best-effort: write failures (unwritable or full disk) are
+        ignored so they never turn a successful API call into an error.
+        """
+        if self.cache_mode != 'enabled':
+            return
+
+        path = self._cache_path(key)
+        # Write to a temp file and rename so concurrent readers never see
+        # a partially written entry
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
         try:
-            with urllib.request.urlopen(req) as response:
-                return json.loads(response.read().decode())
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode()
-            raise Exception(f"Datadog API error: {e.code} - {error_body}")
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with gzip.open(tmp_path, 'wt') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _cached(
+        self,
+        key: str,
+        description: str,
+        fetch,
+        max_age: Optional[float] = None
+    ) -> Dict:
+        """Return a cached response, falling back to fetch() on a miss.
+
+        Args:
+            key: Cache key (from _cache_key)
+            description: Human-readable request description for errors
+            fetch: Callable performing the API request
+            max_age: Optional maximum cached entry age in seconds
+
+        Returns:
+            Dict with API response
+        """
+        cached = self._cache_get(key, max_age)
+        if cached is not None:
+            return cached
+
+        if self.cache_mode == 'replay':
+            raise Exception(f"Cache miss in replay mode: {description}")
+
+        result = fetch()
+        self._cache_put(key, result)
+        return result
 
     def list_dashboards(self) -> List[Dict]:
         """List all dashboards in the account.
 
+        The list is kept in memory for DASHBOARD_LIST_TTL_SECONDS so repeated
+        lookups in the same process don't re-fetch it.
+
         Returns:
             List of dashboard summaries
         """
-        result = self._make_request('/api/v1/dashboard')
-        return result.get('dashboards', [])
+        now = time.monotonic()
+        if (self._dashboards is None
+                or now - self._dashboards_fetched_at > DASHBOARD_LIST_TTL_SECONDS):
+            result = self._make_request('/api/v1/dashboard')
+            self._dashboards = result.get('dashboards', [])
+            self._dashboards_fetched_at = now
+            self._title_index = [
+                (d, (d.get('title') or '').lower()) for d in self._dashboards
+            ]
+        return self._dashboards
 
     def get_dashboard(self, dashboard_id: str) -> Dict:
         """Get dashboard definition by ID.
@@ -74,22 +360,28 @@ class DatadogDashboardQuery:
         Returns:
             Dict with dashboard definition
         """
-        return self._make_request(f'/api/v1/dashboard/{dashboard_id}')
+        return self._cached(
+            self._cache_key('dashboard', dashboard_id),
+            f"dashboard {dashboard_id}",
+            lambda: self._make_request(f'/api/v1/dashboard/{dashboard_id}'),
+            max_age=DASHBOARD_CACHE_TTL_SECONDS
+        )
 
     def search_dashboard(self, query: str) -> List[Dict]:
         """Search for dashboards by name.
 
         Args:
-            query: Search query (dashboard name)
+            query: Search query (dashboard name); every whitespace-separated
+                term must appear in the title
 
         Returns:
             List of matching dashboards
         """
-        dashboards = self.list_dashboards()
-        query_lower = query.lower()
+        self.list_dashboards()
+        terms = query.lower().split()
         return [
-            d for d in dashboards
-            if query_lower in d.get('title', '').lower()
+            d for d, title in self._title_index
+            if all(term in title for term in terms)
         ]
 
     def extract_widget_queries(self, dashboard: Dict) -> List[Dict]:
@@ -101,71 +393,68 @@ class DatadogDashboardQuery:
         Returns:
             List of widget query information
         """
+        def _walk(node, in_request: bool = False):
+            """Yield metric query strings from a widget definition.
+
+            Recurses uniformly into nested widgets (e.g. group widgets),
+            requests and queries. Only string 'q'/'query' leaves found inside
+            requests are collected, and v2 queries for non-metric data
+            sources (logs, events, ...) are skipped since the metrics query
+            endpoint cannot run them.
+            """
+            if isinstance(node, list):
+                for item in node:
+                    yield from _walk(item, in_request)
+                return
+
+            if not isinstance(node, dict):
+                return
+
+            if in_request and node.get('data_source', 'metrics') == 'metrics':
+                for key in ('q', 'query'):
+                    if isinstance(node.get(key), str):
+                        yield node[key]
+
+            for key in ('definition', 'widgets'):
+                if key in node:
+                    yield from _walk(node[key])
+
+            requests = node.get('requests')
+            if isinstance(requests, dict):
+                # e.g. scatterplot requests are keyed by axis ({'x': ..., 'y': ...})
+                requests = list(requests.values())
+            if requests:
+                yield from _walk(requests, True)
+
+            if 'queries' in node:
+                yield from _walk(node['queries'], True)
+
         widgets = []
         widget_list = dashboard.get('widgets', [])
 
         for idx, widget in enumerate(widget_list):
+            definition = widget.get('definition') or {}
             widget_info = {
                 'index': idx,
                 'id': widget.get('id'),
-                'definition': widget.get('definition', {}),
-                'queries': []
+                'definition': definition,
+                'type': definition.get('type', 'unknown'),
+                'title': definition.get('title', f'Widget {idx}'),
+                'queries': list(_walk(definition))
             }
 
-            definition = widget.get('definition', {})
-            widget_type = definition.get('type', 'unknown')
-            widget_info['type'] = widget_type
-            widget_info['title'] = definition.get('title', f'Widget {idx}')
-
-            # Extract queries based on widget type
-            if widget_type == 'timeseries':
-                requests = definition.get('requests', [])
-                for req in requests:
-                    if 'q' in req:
-                        widget_info['queries'].append(req['q'])
-                    if 'queries' in req:
-                        for q in req['queries']:
-                            if 'query' in q:
-                                widget_info['queries'].append(q['query'])
-
-            elif widget_type == 'query_value':
-                requests = definition.get('requests', [])
-                for req in requests:
-                    if 'q' in req:
-                        widget_info['queries'].append(req['q'])
-                    if 'queries' in req:
-                        for q in req['queries']:
-                            if 'query' in q:
-                                widget_info['queries'].append(q['query'])
-
-            elif widget_type == 'toplist':
-                requests = definition.get('requests', [])
-                for req in requests:
-                    if 'q' in req:
-                        widget_info['queries'].append(req['q'])
-                    if 'queries' in req:
-                        for q in req['queries']:
-                            if 'query' in q:
-                                widget_info['queries'].append(q['query'])
-
-            elif widget_type == 'heatmap':
-                requests = definition.get('requests', [])
-                for req in requests:
-                    if 'q' in req:
-                        widget_info['queries'].append(req['q'])
-
-            # Add more widget types as needed
-
             if widget_info['queries']:
                 widgets.append(widget_info)
 
         return widgets
 
-    def analyze_series(self, series: List[Dict]) -> Dict:
+    def analyze_series(self, series: List[Dict], detect_anomalies: bool = True) -> Dict:
         """Analyze series data and return statistics instead of raw data.
 
         Args:
             series: List of series data from Datadog
+            detect_anomalies: If True, flag series whose latest value deviates
+                from the average (default: True)
 
         Returns:
             Dict with analyzed statistics
@@ -180,10 +469,26 @@ class DatadogDashboardQuery:
             if not pointlist:
                 continue
 
-            # Extract values (ignore None/null values)
-            values = [p[1] for p in pointlist if p[1] is not None]
-
-            if not values:
+            # Single pass with running aggregates (ignore None/null values);
+            # avoids materializing a filtered copy of the series
+            count = 0
+            total = 0
+            min_val = max_val = first = latest = None
+            for p in pointlist:
+                value = p[1]
+                if value is None:
+                    continue
+                if count == 0:
+                    min_val = max_val = first = value
+                elif value < min_val:
+                    min_val = value
+                elif value > max_val:
+                    max_val = value
+                total += value
+                latest = value
+                count += 1
+
+            if not count:
                 continue
 
             series_info = {
@@ -192,70 +497,192 @@ class DatadogDashboardQuery:
                 'tag_set': s.get('tag_set', []),
                 'display_name': s.get('display_name', ''),
                 'statistics': {
-                    'min': round(min(values), 2),
-                    'max': round(max(values), 2),
-                    'avg': round(sum(values) / len(values), 2),
-                    'latest': round(values[-1], 2),
-                    'first': round(values[0], 2),
-                    'data_points': len(values)
+                    'min': round(min_val, 2),
+                    'max': round(max_val, 2),
+                    'avg': round(total / count, 2),
+                    'latest': round(latest, 2),
+                    'first': round(first, 2),
+                    'data_points': count
                 }
             }
 
             # Detect anomalies (simple threshold-based)
             avg_val = series_info['statistics']['avg']
-            latest_val = series_info['statistics']['latest']
 
             # Check if latest value is significantly different from average
-            if avg_val > 0:
+            if detect_anomalies and avg_val > 0:
+                latest_val = series_info['statistics']['latest']
                 change_pct = ((latest_val - avg_val) / avg_val) * 100
-                if abs(change_pct) > 20:  # More than 20% change
+                abs_change = abs(change_pct)
+                if abs_change > 20:  # More than 20% change
                     series_info['anomaly'] = {
                         'detected': True,
                         'change_percent': round(change_pct, 2),
-                        'severity': 'HIGH' if abs(change_pct) > 50 else 'MEDIUM'
+                        'severity': 'HIGH' if abs_change > 50 else 'MEDIUM'
                     }
 
             analysis['series_data'].append(series_info)
 
         return analysis
 
-    def execute_query(self, query: str, from_ts: int, to_ts: int) -> Dict:
+    def execute_query(self, query: str, base_params: Dict) -> Dict:
         """Execute a metric query.
 
         Args:
             query: Metric query string
-            from_ts: Start timestamp (Unix seconds)
-            to_ts: End timestamp (Unix seconds)
+            base_params: Time range parameters shared by all queries
+                ({'from': start, 'to': end} in Unix seconds)
 
         Returns:
             Dict with query results
         """
-        url = f"{self.base_url}/api/v1/query"
-        params = {
-            'query': query,
-            'from': from_ts,
-            'to': to_ts
+        params = {'query': query, **base_params}
+
+        return self._cached(
+            self._query_cache_key(query, base_params),
+            f"query {query}",
+            lambda: self._make_request('/api/v1/query', params=params)
+        )
+
+    def _query_cache_key(self, query: str, base_params: Dict) -> str:
+        """Build the cache key for a metric query over a time range."""
+        from_ts = base_params['from']
+        to_ts = base_params['to']
+        return self._cache_key(
+            'query',
+            query,
+            from_ts - from_ts % CACHE_BUCKET_SECONDS,
+            to_ts - to_ts % CACHE_BUCKET_SECONDS
+        )
+
+    def execute_queries_batch(
+        self,
+        queries: List[str],
+        base_params: Dict
+    ) -> Dict[str, Dict]:
+        """Execute several metric queries in a single v2 timeseries request.
+
+        Cached queries are served from the cache; the rest are sent together
+        to /api/v2/query/timeseries and converted to the v1 /query response
+        shape so they can be analyzed the same way.
+
+        Args:
+            queries: Metric query strings
+            base_params: Time range parameters shared by all queries
+                ({'from': start, 'to': end} in Unix seconds)
+
+        Returns:
+            Dict mapping each query to its results ({'series': [...]})
+        """
+        results = {}
+        pending = []
+        for query in queries:
+            cached = self._cache_get(self._query_cache_key(query, base_params))
+            if cached is not None:
+                results[query] = cached
+            else:
+                pending.append(query)
+
+        if not pending:
+            return results
+
+        if self.cache_mode == 'replay':
+            raise Exception(f"Cache miss in replay mode: {len(pending)} batched queries")
+
+        body = {
+            'data': {
+                'type': 'timeseries_request',
+                'attributes': {
+                    'formulas': [{'formula': f'q{i}'} for i in range(len(pending))],
+                    'queries': [
+                        {'data_source': 'metrics', 'name': f'q{i}', 'query': query}
+                        for i, query in enumerate(pending)
+                    ],
+                    'from': base_params['from'] * 1000,
+                    'to': base_params['to'] * 1000
+                }
+            }
         }
+        response = self._make_request('/api/v2/query/timeseries', method='POST', body=body)
+
+        # Query failures can come back inside an HTTP 200; treating them as
+        # empty results would report (and cache) a false "no data"
+        attributes = response.get('data', {}).get('attributes', {})
+        errors = response.get('errors') or attributes.get('errors')
+        if errors:
+            raise Exception(f"Datadog API error: {errors}")
+
+        times = attributes.get('times', [])
+        batch_results = {query: {'series': []} for query in pending}
+
+        for s, values in zip(attributes.get('series', []), attributes.get('values', [])):
+            query = pending[s['query_index']]
+            tag_set = s.get('group_tags') or []
+            batch_results[query]['series'].append({
+                # Extract metric name from "avg:metric.name{tags}"
+                'metric': query.split(':', 1)[-1].split('{', 1)[0],
+                'scope': ','.join(tag_set) or '*',
+                'tag_set': tag_set,
+                'display_name': query,
+                'pointlist': [[ts, value] for ts, value in zip(times, values)]
+            })
+
+        for query, result in batch_results.items():
+            self._cache_put(self._query_cache_key(query, base_params), result)
+
+        results.update(batch_results)
+        return results
+
+    def _run_query(
+        self,
+        query: str,
+        base_params: Dict
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """Execute a query, capturing any error instead of raising.
+
+        Args:
+            query: Metric query string
+            base_params: Time range parameters shared by all queries
+
+        Returns:
+            Tuple of (result, error message); exactly one of them is None
+        """
+        try:
+            return self.execute_query(query, base_params), None
+        except Exception as e:
+            return None, str(e)
 
-        url_with_params = f"{url}?{urllib.parse.urlencode(params)}"
+    def _run_batch(
+        self,
+        queries: List[str],
+        base_params: Dict
+    ) -> Optional[Dict[str, Tuple[Optional[Dict], Optional[str]]]]:
+        """Execute a chunk of queries as one batch, capturing errors.
 
-        req = urllib.request.Request(url_with_params)
-        req.add_header('DD-API-KEY', self.api_key)
-        req.add_header('DD-APPLICATION-KEY', self.app_key)
+        Args:
+            queries: Metric query strings
+            base_params: Time range parameters shared by all queries
 
+        Returns:
+            Dict mapping each query to a (result, error message) tuple, or
+            None if the batch request failed (e.g. one query uses syntax the
+            v2 API rejects) so the caller can retry each query individually
+        """
         try:
-            with urllib.request.urlopen(req) as response:
-                return json.loads(response.read().decode())
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode()
-            raise Exception(f"Datadog API error: {e.code} - {error_body}")
+            results = self.execute_queries_batch(queries, base_params)
+        except Exception:
+            return None
+
+        return {query: (results[query], None) for query in queries}
 
     def query_dashboard_widgets(
         self,
         dashboard_id: str,
         from_time: datetime,
         to_time: datetime,
-        analyze: bool = True
+        analyze: bool = True,
+        detect_anomalies: bool = True,
+        batch: bool = False
     ) -> Dict:
         """Query all widgets in a dashboard.
 
@@ -264,6 +691,9 @@ class DatadogDashboardQuery:
             from_time: Start time for queries
             to_time: End time for queries
             analyze: If True, analyze series data instead of returning raw data (default: True)
+            detect_anomalies: If True, include anomaly detection in the analysis (default: True)
+            batch: If True, send queries in chunks of BATCH_QUERY_SIZE through the
+                v2 timeseries API instead of one v1 request each (default: False)
 
         Returns:
             Dict with dashboard and widget query results
@@ -288,6 +718,10 @@ class DatadogDashboardQuery:
         from_ts = int(from_time.timestamp())
         to_ts = int(to_time.timestamp())
 
+        # Time range parameters are identical for every query, so build them
+        # once and merge each query string in at request time
+        base_params = {'from': from_ts, 'to': to_ts}
+
         results = {
             'metadata': {
                 'dashboard_id': dashboard_id,
@@ -308,6 +742,48 @@ class DatadogDashboardQuery:
         successful_queries = 0
         failed_queries = 0
 
+        # Dashboards often reuse the same query across widgets, so execute
+        # each distinct query once and fan the result back out to every
+        # widget that references it
+        unique_queries = list(dict.fromkeys(
+            query for widget in widgets for query in widget['queries']
+        ))
+
+        # Execute distinct queries concurrently; the workload is dominated
+        # by network round-trips, so overlapping them cuts wall-clock time
+        # from ~N*RTT to roughly the slowest single query
+        run_single = lambda chunk: {chunk[0]: self._run_query(chunk[0], base_params)}
+        if batch:
+            chunks = [
+                unique_queries[i:i + BATCH_QUERY_SIZE]
+                for i in range(0, len(unique_queries), BATCH_QUERY_SIZE)
+            ]
+            run = lambda chunk: self._run_batch(chunk, base_params)
+        else:
+            chunks = [[query] for query in unique_queries]
+            run = run_single
+
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(run, chunk): chunk for chunk in chunks}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    chunk_outcomes = future.result()
+                    if chunk_outcomes is None:
+                        # Batch rejected: retry its queries individually,
+                        # in parallel, through the v1 endpoint
+                        for query in chunk:
+                            pending[executor.submit(run_single, [query])] = [query]
+                    else:
+                        outcomes.update(chunk_outcomes)
+
+        if len(unique_queries) < total_queries:
+            print(f"Executed {len(unique_queries)} unique queries "
+                  f"({total_queries - len(unique_queries)} duplicates reused)")
+            print()
+
         for widget in widgets:
             widget_result = {
                 'index': widget['index'],
@@ -317,50 +793,62 @@ class DatadogDashboardQuery:
                 'queries': []
             }
 
-            print(f"Widget {widget['index']}: {widget['title']} ({widget['type']})")
+            # Collect this widget's log lines and write them in one call
+            # rather than one print (and flush) per line
+            lines = [f"Widget {widget['index']}: {widget['title']} ({widget['type']})"]
 
             for query in widget['queries']:
-                print(f"  Query: {query}")
-
-                try:
-                    result = self.execute_query(query, from_ts, to_ts)
-
-                    if result.get('series'):
-                        # Analyze or save raw data based on mode
-                        if analyze:
-                            analysis = self.analyze_series(result['series'])
-                            widget_result['queries'].append({
-                                'query': query,
-                                'status': 'success',
-                                'analysis': analysis
-                            })
-                            print(f"    ✓ Success ({analysis['series_count']} series analyzed)")
-                        else:
-                            widget_result['queries'].append({
-                                'query': query,
-                                'status': 'success',
-                                'series': result['series']
-                            })
-                            print(f"    ✓ Success ({len(result['series'])} series)")
-                        successful_queries += 1
+                lines.append(f"  Query: {query}")
+
+                result, error = outcomes[query]
+
+                # Analysis failures (e.g. a malformed series) are recorded as
+                # an error for this query only, like a failed fetch
+                analysis = None
+                if error is None and analyze and result.get('series'):
+                    try:
+                        analysis = self.analyze_series(result['series'], detect_anomalies)
+                    except Exception as e:
+                        error = str(e)
+
+                if error is not None:
+                    widget_result['queries'].append({
+                        'query': query,
+                        'status': 'error',
+                        'error': error
+                    })
+                    lines.append(f"    ✗ Error: {error}")
+                    failed_queries += 1
+
+                elif result.get('series'):
+                    # Analyze or save raw data based on mode
+                    if analyze:
+                        widget_result['queries'].append({
+                            'query': query,
+                            'status': 'success',
+                            'analysis': analysis
+                        })
+                        lines.append(f"    ✓ Success ({analysis['series_count']} series analyzed)")
                     else:
                         widget_result['queries'].append({
                             'query': query,
-                            'status': 'no_data'
+                            'status': 'success',
+                            'series': result['series']
                         })
-                        print(f"    ✗ No data")
+                        lines.append(f"    ✓ Success ({len(result['series'])} series)")
+                    successful_queries += 1
 
-                except Exception as e:
+                else:
                     widget_result['queries'].append({
                         'query': query,
-                        'status': 'error',
-                        'error': str(e)
+                        'status': 'no_data'
                     })
-                    print(f"    ✗ Error: {str(e)}")
-                    failed_queries += 1
+                    lines.append("    ✗ No data")
 
             results['widgets'].append(widget_result)
-            print()
+            sys.stdout.write('\n'.join(lines) + '\n\n')
+
+        sys.stdout.flush()
 
         # Print summary
         print(f"{'='*60}")
@@ -373,6 +861,7 @@ class DatadogDashboardQuery:
 
         results['metadata']['query_summary'] = {
             'total_queries': total_queries,
+            'unique_queries': len(unique_queries),
             'successful': successful_queries,
             'failed': failed_queries
         }
@@ -380,16 +869,26 @@ class DatadogDashboardQuery:
         return results
 
 
+def write_json(data: Dict, stream) -> None:
+    """Write data as indented JSON to a binary stream.
+
+    Uses orjson when available (serializes straight to bytes); otherwise
+    streams through the stdlib encoder without building the whole document
+    as one string first.
+    """
+    if orjson:
+        stream.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    writer = io.TextIOWrapper(stream, encoding='utf-8')
+    json.dump(data, writer, indent=2, ensure_ascii=False)
+    writer.flush()
+    writer.detach()
+
+
 def parse_datetime(dt_str: str) -> datetime:
     """Parse datetime string in various formats."""
-    formats = [
-        '%Y-%m-%d %H:%M:%S',
-        '%Y-%m-%dT%H:%M:%S',
-        '%Y-%m-%d %H:%M',
-        '%Y-%m-%dT%H:%M',
-    ]
-
-    for fmt in formats:
+    for fmt in _DT_FORMATS:
         try:
             return datetime.strptime(dt_str, fmt)
         except ValueError:
@@ -399,25 +898,27 @@ def parse_datetime(dt_str: str) -> datetime:
     if 'ago' in dt_str:
         parts = dt_str.replace('ago', '').strip().split()
         if len(parts) >= 1:
-            # Handle "1h ago" format
-            time_str = parts[0]
-            # Extract number and unit
-            import re
-            match = re.match(r'(\d+)([a-z]+)', time_str)
-            if match:
+            # Handle "1h ago" format: extract number and unit
+            match = _RELATIVE_TIME_RE.match(parts[0])
+            if match and match.group(2) in _TIME_UNITS:
                 amount = int(match.group(1))
-                unit = match.group(2)
-
-                if unit in ['m', 'min', 'minute', 'minutes']:
-                    return datetime.now() - timedelta(minutes=amount)
-                elif unit in ['h', 'hr', 'hour', 'hours']:
-                    return datetime.now() - timedelta(hours=amount)
-                elif unit in ['d', 'day', 'days']:
-                    return datetime.now() - timedelta(days=amount)
+                unit = _TIME_UNITS[match.group(2)]
+                return datetime.now() - timedelta(**{unit: amount})
 
     raise ValueError(f"Unable to parse datetime: {dt_str}")
 
 
+def positive_int(value: str) -> int:
+    """argparse type for integers greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Query Datadog dashboard and execute widget queries'
@@ -474,6 +975,12 @@ def main():
         help='Return raw timeseries data instead of analyzed summary (uses more tokens)'
     )
 
+    parser.add_argument(
+        '--no-anomalies',
+        action='store_true',
+        help='Skip anomaly detection in analyze mode and return statistics only'
+    )
+
     parser.add_argument(
         '--api-key',
         type=str,
@@ -495,8 +1002,38 @@ def main():
         help='Datadog site (default: datadoghq.eu)'
     )
 
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help=f'Send up to {BATCH_QUERY_SIZE} queries per request via the v2 timeseries API '
+             '(fewer round-trips; falls back to per-query requests if a batch fails)'
+    )
+
+    parser.add_argument(
+        '--max-workers',
+        type=positive_int,
+        default=MAX_CONCURRENT_QUERIES,
+        help=f'Maximum number of widget queries to run concurrently (default: {MAX_CONCURRENT_QUERIES})'
+    )
+
+    parser.add_argument(
+        '--cache-mode',
+        type=str,
+        choices=CACHE_MODES,
+        default=os.getenv('DD_CACHE_MODE', 'disabled'),
+        help='On-disk response cache under ~/.cache/dd_dashq: enabled, read-only, '
+             'replay (fail on cache miss, no API calls), disabled (default: disabled)'
+    )
+
     args = parser.parse_args()
 
+    # argparse doesn't check choices against defaults (DD_CACHE_MODE)
+    if args.cache_mode not in CACHE_MODES:
+        parser.error(
+            f"invalid cache mode {args.cache_mode!r} from DD_CACHE_MODE "
+            f"(choose from {', '.join(CACHE_MODES)})"
+        )
+
     # Validate credentials
     if not args.api_key or not args.app_key:
         print("Error: Datadog API credentials required", file=sys.stderr)
@@ -504,78 +1041,93 @@ def main():
         print("Or use --api-key and --app-key arguments", file=sys.stderr)
         sys.exit(1)
 
-    client = DatadogDashboardQuery(args.api_key, args.app_key, args.site)
-
-    # List dashboards
-    if args.list:
-        print("Fetching dashboards...")
-        dashboards = client.list_dashboards()
-        print(f"\nFound {len(dashboards)} dashboards:\n")
-        for db in dashboards:
-            print(f"  {db['id']}: {db.get('title', 'Untitled')}")
-            if db.get('description'):
-                print(f"    Description: {db['description']}")
-            print()
-        sys.exit(0)
+    client = DatadogDashboardQuery(
+        args.api_key,
+        args.app_key,
+        args.site,
+        cache_mode=args.cache_mode,
+        max_workers=args.max_workers
+    )
 
-    # Search dashboards
-    if args.search:
-        print(f"Searching for dashboards matching: {args.search}")
-        dashboards = client.search_dashboard(args.search)
+    with client:
+        # List dashboards
+        if args.list:
+            print("Fetching dashboards...")
+            dashboards = client.list_dashboards()
+            print(f"\nFound {len(dashboards)} dashboards:\n")
+            for db in dashboards:
+                print(f"  {db['id']}: {db.get('title', 'Untitled')}")
+                if db.get('description'):
+                    print(f"    Description: {db['description']}")
+                print()
+            sys.exit(0)
 
-        if not dashboards:
-            print("No dashboards found matching the query")
+        # Search dashboards
+        if args.search:
+            print(f"Searching for dashboards matching: {args.search}")
+            dashboards = client.search_dashboard(args.search)
+
+            if not dashboards:
+                print("No dashboards found matching the query")
+                sys.exit(1)
+
+            print(f"\nFound {len(dashboards)} matching dashboard(s):\n")
+            for db in dashboards:
+                print(f"  {db['id']}: {db.get('title', 'Untitled')}")
+                if db.get('description'):
+                    print(f"    Description: {db['description']}")
+                print()
+
+            if len(dashboards) == 1:
+                args.dashboard_id = dashboards[0]['id']
+                print(f"Using dashboard: {args.dashboard_id}\n")
+            else:
+                print("Multiple dashboards found. Please specify --dashboard-id")
+                sys.exit(0)
+
+        # Query dashboard
+        if not args.dashboard_id:
+            print("Error: --dashboard-id or --search required", file=sys.stderr)
+            print("Use --list to see available dashboards", file=sys.stderr)
             sys.exit(1)
 
-        print(f"\nFound {len(dashboards)} matching dashboard(s):\n")
-        for db in dashboards:
-            print(f"  {db['id']}: {db.get('title', 'Untitled')}")
-            if db.get('description'):
-                print(f"    Description: {db['description']}")
-            print()
-
-        if len(dashboards) == 1:
-            args.dashboard_id = dashboards[0]['id']
-            print(f"Using dashboard: {args.dashboard_id}\n")
+        # Parse time range
+        if args.from_time.lower() == 'now':
+            from_time = datetime.now()
         else:
-            print("Multiple dashboards found. Please specify --dashboard-id")
-            sys.exit(0)
+            from_time = parse_datetime(args.from_time)
 
-    # Query dashboard
-    if not args.dashboard_id:
-        print("Error: --dashboard-id or --search required", file=sys.stderr)
-        print("Use --list to see available dashboards", file=sys.stderr)
-        sys.exit(1)
-
-    # Parse time range
-    if args.from_time.lower() == 'now':
-        from_time = datetime.now()
-    else:
-        from_time = parse_datetime(args.from_time)
-
-    if args.to_time.lower() == 'now':
-        to_time = datetime.now()
-    else:
-        to_time = parse_datetime(args.to_time)
-
-    # Determine analyze mode (analyze by default unless --raw is specified)
-    analyze_mode = not args.raw
-
-    # Query dashboard widgets
-    results = client.query_dashboard_widgets(args.dashboard_id, from_time, to_time, analyze=analyze_mode)
-
-    # Output results
-    output_json = json.dumps(results, indent=2)
-
-    if args.output:
-        with open(args.output, 'w') as f:
-            f.write(output_json)
-        print(f"✓ Results saved to: {args.output}")
-    else:
-        print("\n" + "="*80)
-        print("RESULTS")
-        print("="*80)
-        print(output_json)
+        if args.to_time.lower() == 'now':
+            to_time = datetime.now()
+        else:
+            to_time = parse_datetime(args.to_time)
+
+        # Determine analyze mode (analyze by default unless --raw is specified)
+        analyze_mode = not args.raw
+
+        # Query dashboard widgets
+        results = client.query_dashboard_widgets(
+            args.dashboard_id,
+            from_time,
+            to_time,
+            analyze=analyze_mode,
+            detect_anomalies=not args.no_anomalies,
+            batch=args.batch
+        )
+
+        # Output results
+        if args.output:
+            with open(args.output, 'wb') as f:
+                write_json(results, f)
+            print(f"✓ Results saved to: {args.output}")
+        else:
+            print("\n" + "="*80)
+            print("RESULTS")
+            print("="*80)
+            sys.stdout.flush()
+            write_json(results, sys.stdout.buffer)
+            sys.stdout.buffer.write(b'\n')
+            sys.stdout.flush()
 
 
 if __name__ == '__main__':
@@ -12,9 +12,8 @@ import json
 import argparse
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import urllib.request
-import urllib.parse
-import urllib.error
+
+import requests
 
 
 class DatadogMetricsQuery:
@@ -66,6 +65,24 @@ class DatadogMetricsQuery:
         self.app_key = app_key
         self.base_url = f"https://api.{site}"
 
+        # Shared session so repeated metric queries reuse keep-alive connections;
+        # requests negotiates gzip (Accept-Encoding) and decompresses responses
+        self.session = requests.Session()
+        self.session.headers.update({
+            'DD-API-KEY': api_key,
+            'DD-APPLICATION-KEY': app_key
+        })
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def query_metric(
         self,
         query: str,
@@ -82,25 +99,15 @@ class DatadogMetricsQuery:
         Returns:
             Dict with query results
         """
-        url = f"{self.base_url}/api/v1/query"
-        params = {
-            'query': query,
-            'from': from_ts,
-            'to': to_ts
-        }
-
-        url_with_params = f"{url}?{urllib.parse.urlencode(params)}"
+        response = self.session.get(
+            f"{self.base_url}/api/v1/query",
+            params={'query': query, 'from': from_ts, 'to': to_ts}
+        )
 
-        req = urllib.request.Request(url_with_params)
-        req.add_header('DD-API-KEY', self.api_key)
-        req.add_header('DD-APPLICATION-KEY', self.app_key)
+        if not response.ok:
+            raise Exception(f"Datadog API error: {response.status_code} - {response.text}")
 
-        try:
-            with urllib.request.urlopen(req) as response:
-                return json.loads(response.read().decode())
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode()
-            raise Exception(f"Datadog API error: {e.code} - {error_body}")
+        return response.json()
 
     def build_queries(
         self,
@@ -419,17 +426,16 @@ def main():
             tag_filters[key.strip()] = value.strip()
 
     # Query metrics
-    client = DatadogMetricsQuery(args.api_key, args.app_key, args.site)
-
-    results = client.query_incident_metrics(
-        components=components,
-        incident_time=incident_time,
-        metric_types=metric_types,
-        before_minutes=args.before,
-        after_minutes=args.after,
-        tag_type=args.tag_type,
-        tag_filters=tag_filters
-    )
+    with DatadogMetricsQuery(args.api_key, args.app_key, args.site) as client:
+        results = client.query_incident_metrics(
+            components=components,
+            incident_time=incident_time,
+            metric_types=metric_types,
+            before_minutes=args.before,
+            after_minutes=args.after,
+            tag_type=args.tag_type,
+            tag_filters=tag_filters
+        )
 
     # Output results
     output_json = json.dumps(results, indent=2)